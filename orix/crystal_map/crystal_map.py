@@ -285,8 +285,7 @@ class CrystalMap:
             self._phases = phase_list
 
         # Set whether measurements are indexed
-        is_indexed = np.ones(data_size, dtype=bool)
-        is_indexed[np.where(phase_id == -1)] = False
+        is_indexed = phase_id != -1
 
         # Add "not_indexed" to phase list and ensure not indexed points
         # have correct phase ID
@@ -1188,10 +1187,10 @@ def create_coordinate_arrays(
     d = dict()
 
     # Add coordinate arrays depending on the number of map dimensions
-    d["x"] = np.tile(np.arange(nx) * dx, ny).flatten()
+    d["x"] = np.tile(np.arange(nx) * dx, ny)
     map_size = nx
     if ndim > 1:
-        d["y"] = np.sort(np.tile(np.arange(ny) * dy, nx)).flatten()
+        d["y"] = np.repeat(np.arange(ny) * dy, nx)
         map_size *= ny
 
     return d, map_size
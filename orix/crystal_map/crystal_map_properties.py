@@ -16,6 +16,8 @@
 # You should have received a copy of the GNU General Public License
 # along with orix.  If not, see <http://www.gnu.org/licenses/>.
 
+import weakref
+
 import numpy as np
 
 
@@ -52,6 +54,10 @@ class CrystalMapProperties(dict):
             data.
         """
         super().__init__(**dictionary)
+        # Arrays created in __setitem__(), which can be updated in-place
+        # as they are not shared with the caller. Weak references are
+        # kept so that deleted properties are freed.
+        self._own_arrays = weakref.WeakValueDictionary()
         self.id = id
         if is_in_data is None:
             self.is_in_data = np.ones(id.size, dtype=bool)
@@ -77,18 +83,33 @@ class CrystalMapProperties(dict):
         else:
             array_shape = (self.is_in_data.size,)
 
-        # Get array values if `key` already present, or zeros
-        array = self.setdefault(key, np.zeros(array_shape))
+        # Get array values if `key` already present, or zeros. The zeros
+        # are only allocated when needed, and skipped if all values are
+        # overwritten below.
+        array = self.get(key)
+        if array is None:
+            if self.is_in_data.all():
+                array = np.empty(array_shape, dtype=value.dtype)
+            else:
+                array = np.zeros(array_shape)
+            is_own_array = True
+        else:
+            is_own_array = self._own_arrays.get(key) is array
 
-        # Set correct data type
-        array = array.astype(value.dtype)
+        # Set correct data type. Arrays not created here might be shared
+        # with the caller or be read-only, so these are always copied.
+        array = array.astype(value.dtype, copy=not is_own_array)
 
         array[self.is_in_data, ...] = value
         super().__setitem__(key, array)
+        self._own_arrays[key] = array
 
     def __getitem__(self, item):
         """Return a dictionary entry, ensuring that only points in the data
         are returned.
         """
         array = super().__getitem__(item)
+        if self.is_in_data.all():
+            # All points are in the data, so no gathering is needed
+            return array.copy()
         return array[self.is_in_data]
@@ -107,7 +107,9 @@ def load(filename: Union[str, Path], **kwargs) -> CrystalMap:
     **kwargs
         Keyword arguments passed to the corresponding plugins'
         ``file_reader()``. See their individual docstrings for available
-        arguments.
+        arguments. For example, pass ``use_cache=True`` when reading an
+        .ang file to cache the parsed data to a NumPy file next to the
+        .ang file, which is read instead on subsequent loads.
 
     Returns
     -------
@@ -21,6 +21,7 @@ TSL, NanoMegas ASTAR Index or EMsoft's EMdpmerge program.
 """
 
 from io import TextIOWrapper
+import os
 import re
 from typing import List, Optional, Tuple, Union
 import warnings
@@ -41,8 +42,23 @@ file_extensions = ["ang"]
 writes = True
 writes_this = CrystalMap
 
-
-def file_reader(filename: str) -> CrystalMap:
+# Pattern of phase information in the header, compiled once. The name
+# of the matched group is the key of the phase information.
+_PHASE_PATTERN = re.compile(
+    "# (?:"
+    "(?P<ids>Phase)[ \t]+[0-9 ]"
+    "|(?P<names>MaterialName)[ \t]+[A-z0-9 ]"
+    "|(?P<formulas>Formula)[ \t]+[A-z0-9 ]"
+    "|(?P<point_groups>Symmetry)[ \t]+[A-z0-9 ]"
+    "|(?P<lattice_constants>LatticeConstants)[ \t+]"
+    ")"
+)
+_WHITESPACE_PATTERN = re.compile("[ \t]")
+# Pattern of a format specifier in a data row format, e.g. "%8.5f"
+_FORMAT_SPECIFIER_PATTERN = re.compile(r"%[-+ 0#]*[0-9]*(?:\.[0-9]+)?[a-zA-Z]")
+
+
+def file_reader(filename: str, use_cache: bool = False) -> CrystalMap:
     """Return a crystal map from a file in EDAX TLS's .ang format.
 
     The map in the input is assumed to be 2D.
@@ -64,6 +80,13 @@ def file_reader(filename: str) -> CrystalMap:
     ----------
     filename
         Path and file name.
+    use_cache
+        Whether to save the parsed file data to a NumPy file next to the
+        .ang file, with an additional ``".npy"`` file extension, and to
+        read the data from this file on subsequent loads instead of
+        parsing the .ang file again. The cache is only used if it is
+        newer than the .ang file. If the cache cannot be saved, a
+        warning is raised. Default is ``False``.
 
     Returns
     -------
@@ -72,7 +95,7 @@ def file_reader(filename: str) -> CrystalMap:
     """
     # Get file header
     with open(filename) as f:
-        header = _get_header(f)
+        header, data_starting_row = _get_header(f)
 
     # Phase information, potentially empty
     phases = _get_phases_from_header(header)
@@ -82,27 +105,35 @@ def file_reader(filename: str) -> CrystalMap:
         structure = Structure(title=name, lattice=Lattice(*abcABG))
         phases["structures"].append(structure)
 
-    # Read all file data
-    file_data = np.loadtxt(filename)
+    # Read all file data, potentially from a cache
+    cache_file = f"{filename}.npy"
+    if (
+        use_cache
+        and os.path.isfile(cache_file)
+        and os.path.getmtime(cache_file) >= os.path.getmtime(filename)
+    ):
+        file_data = np.load(cache_file)
+    else:
+        file_data = _get_file_data(filename, data_starting_row)
+        if use_cache:
+            try:
+                np.save(cache_file, file_data)
+            except OSError as e:
+                warnings.warn(f"Could not save cache file '{cache_file}': {e}")
 
     # Get vendor and column names
     vendor, column_names = _get_vendor_columns(header, file_data.shape[1])
 
-    # Data needed to create a CrystalMap object
-    data_dict = {
-        "euler1": None,
-        "euler2": None,
-        "euler3": None,
-        "x": None,
-        "y": None,
-        "phase_id": None,
-        "prop": {},
-    }
-    for column, name in enumerate(column_names):
-        if name in data_dict:
-            data_dict[name] = file_data[:, column]
-        else:
-            data_dict["prop"][name] = file_data[:, column]
+    # Euler angles are always in the first three columns. Split the
+    # other data into contiguous columns.
+    eulers = np.ascontiguousarray(file_data[:, :3])
+    columns = dict(zip(column_names[3:], np.ascontiguousarray(file_data[:, 3:].T)))
+
+    # Data needed to create a CrystalMap object, with the remaining
+    # columns as properties
+    names = ["x", "y", "phase_id"]
+    data_dict = {name: columns.pop(name) for name in names}
+    data_dict["prop"] = columns
 
     # Add phase list to dictionary
     data_dict["phase_list"] = PhaseList(**phases)
@@ -121,17 +152,14 @@ def file_reader(filename: str) -> CrystalMap:
     data_dict["scan_unit"] = scan_unit
 
     # Create rotations
-    data_dict["rotations"] = Rotation.from_euler(
-        np.column_stack(
-            (data_dict.pop("euler1"), data_dict.pop("euler2"), data_dict.pop("euler3"))
-        ),
-    )
+    data_dict["rotations"] = Rotation.from_euler(eulers)
 
     return CrystalMap(**data_dict)
 
 
-def _get_header(file: TextIOWrapper) -> List[str]:
-    """Return the first lines starting with '#' in an .ang file.
+def _get_header(file: TextIOWrapper) -> Tuple[List[str], int]:
+    """Return the first lines starting with '#' in an .ang file and the
+    row number of the start of the data.
 
     Parameters
     ----------
@@ -142,6 +170,8 @@ def _get_header(file: TextIOWrapper) -> List[str]:
     -------
     header
         List with header lines as individual elements.
+    data_starting_row
+        The starting row number for the data lines.
     """
     header = []
     line = file.readline()
@@ -151,7 +181,27 @@ def _get_header(file: TextIOWrapper) -> List[str]:
         header.append(line.rstrip())
         line = file.readline()
         i += 1
-    return header
+    return header, i
+
+
+def _get_file_data(filename: str, data_starting_row: int = 0) -> np.ndarray:
+    """Return the numeric data in an .ang file as a 2D array.
+
+    Parameters
+    ----------
+    filename
+        Path and file name.
+    data_starting_row
+        The starting row number for the data lines. The header lines
+        before this row are skipped without being parsed. Default is 0.
+
+    Returns
+    -------
+    file_data
+        Array of shape (n_points, n_columns) of 64-bit floats, so that
+        values are written back unchanged by :func:`file_writer`.
+    """
+    return np.loadtxt(filename, skiprows=data_starting_row)
 
 
 def _get_vendor_columns(header: List[str], n_cols_file: int) -> Tuple[str, List[str]]:
@@ -173,20 +223,19 @@ def _get_vendor_columns(header: List[str], n_cols_file: int) -> Tuple[str, List[
     column_names
         List of column names.
     """
-    # Determine vendor by searching for vendor footprint in header
+    # Determine vendor by searching for vendor footprint in header, in
+    # order of precedence
     vendor_footprint = {
-        "emsoft": "EMsoft",
-        "astar": "ACOM",
         "orix": "Column names: phi1, Phi, phi2",
+        "astar": "ACOM",
+        "emsoft": "EMsoft",
     }
     vendor = "tsl"  # Default guess
-    footprint_line = None
+    full_header = "\n".join(header)
     for name, footprint in vendor_footprint.items():
-        for line in header:
-            if footprint in line:
-                vendor = name
-                footprint_line = line
-                break
+        if footprint in full_header:
+            vendor = name
+            break
 
     # Variants of vendor column names encountered in real data sets
     column_names = {
@@ -275,9 +324,11 @@ def _get_vendor_columns(header: List[str], n_cols_file: int) -> Tuple[str, List[
 
     n_variants = len(column_names[vendor])
     n_cols_expected = [len(column_names[vendor][k]) for k in range(n_variants)]
-    if vendor == "orix" and "Column names" in footprint_line:
+    if vendor == "orix":
         # Append names of extra properties found, if any, in the orix
         # .ang file header
+        footprint = vendor_footprint[vendor]
+        footprint_line = next(line for line in header if footprint in line)
         vendor_column_names = column_names[vendor][0]
         n_cols = n_cols_expected[0]
         extra_props = footprint_line.split(":")[1].split(",")[n_cols:]
@@ -326,13 +377,6 @@ def _get_phases_from_header(header: List[str]) -> dict:
     formats: EDAX TSL OIM Data Collection v7, ASTAR Index, and EMsoft
     v4/v5.
     """
-    str_patterns = {
-        "ids": "# Phase([ \t]+)([0-9 ]+)",
-        "names": "# MaterialName([ \t]+)([A-z0-9 ]+)",
-        "formulas": "# Formula([ \t]+)([A-z0-9 ]+)",
-        "point_groups": "# Symmetry([ \t]+)([A-z0-9 ]+)",
-        "lattice_constants": r"# LatticeConstants([ \t+])(.*)",
-    }
     phases = {
         "ids": [],
         "names": [],
@@ -341,18 +385,19 @@ def _get_phases_from_header(header: List[str]) -> dict:
         "lattice_constants": [],
     }
     for line in header:
-        for key, exp in str_patterns.items():
-            match = re.search(exp, line)
-            if match:
-                group = re.split("[ \t]", line.lstrip("# ").rstrip(" "))
-                group = list(filter(None, group))
-                if key == "names":
-                    group = " ".join(group[1:])  # Drop "MaterialName"
-                elif key == "lattice_constants":
-                    group = [float(i) for i in group[1:]]
-                else:
-                    group = group[-1]
-                phases[key].append(group)
+        match = _PHASE_PATTERN.match(line)
+        if match is None:
+            continue
+        key = match.lastgroup
+        group = _WHITESPACE_PATTERN.split(line.lstrip("# ").rstrip(" "))
+        group = list(filter(None, group))
+        if key == "names":
+            group = " ".join(group[1:])  # Drop "MaterialName"
+        elif key == "lattice_constants":
+            group = [float(i) for i in group[1:]]
+        else:
+            group = group[-1]
+        phases[key].append(group)
 
     n_phases = len(phases["names"])
 
@@ -468,8 +513,6 @@ def file_writer(
     d, _ = create_coordinate_arrays((nrows, ncols), (dy, dx))
     x = d["x"]
     y = d["y"]
-    x_width = _get_column_width(np.max(x))
-    y_width = _get_column_width(np.max(y))
 
     # Properties
     desired_prop_names = [
@@ -497,11 +540,9 @@ def file_writer(
     prop_arrays[~indexed_points, 1] = -1  # CI
     prop_arrays[~indexed_points, 3] = 180  # Pattern fit
     prop_arrays[~indexed_points, 4:] = 0
-    # Get property column widths
-    prop_widths = [
-        _get_column_width(np.max(prop_arrays[:, i]))
-        for i in range(prop_arrays.shape[1])
-    ]
+    # Get coordinate and property column widths
+    max_values = np.concatenate([[x.max(), y.max()], prop_arrays.max(axis=0)])
+    x_width, y_width, *prop_widths = _get_column_width(max_values, decimals)
 
     # Phase ID
     original_phase_ids = xmap.get_map_data("phase_id").reshape(map_size)
@@ -536,9 +577,9 @@ def file_writer(
     header += "\n"
 
     # Finally, write everything to file
-    np.savetxt(
-        fname=filename,
-        X=np.column_stack(
+    _write_data(
+        filename=filename,
+        data=np.column_stack(
             [eulers, x, y, prop_arrays[:, :2], new_phase_ids, prop_arrays[:, 2:]]
         ),
         fmt=fmt,
@@ -546,6 +587,60 @@ def file_writer(
     )
 
 
+def _write_data(
+    filename: str,
+    data: np.ndarray,
+    fmt: str,
+    header: str,
+    chunk_size: int = 65_536,
+):
+    """Write a header and data to a text file.
+
+    The output is the same as from :func:`numpy.savetxt`, but a chunk
+    of rows is formatted in one string formatting operation instead of
+    one operation per row, which is faster for large maps. Columns with
+    the same value in all rows, like properties not in the crystal map
+    which are written as zeros, are formatted only once.
+
+    Parameters
+    ----------
+    filename
+        File name to write to.
+    data
+        2D array of shape (n_points, n_columns).
+    fmt
+        Format of one row, with one format specifier per column.
+    header
+        Header to write before the data, with each line prepended by
+        ``"# "``.
+    chunk_size
+        Number of rows to format at a time. Default is 65 536.
+    """
+    if data.shape[0] > 0:
+        # Insert formatted values of constant columns into the format,
+        # also requiring equal signs to not mix up 0 and -0
+        is_constant = np.all(data == data[0], axis=0) & np.all(
+            np.signbit(data) == np.signbit(data[0]), axis=0
+        )
+        if is_constant.any():
+            specifiers = _FORMAT_SPECIFIER_PATTERN.findall(fmt)
+            literals = _FORMAT_SPECIFIER_PATTERN.split(fmt)
+            for i in np.flatnonzero(is_constant):
+                specifiers[i] = (specifiers[i] % data[0, i]).replace("%", "%%")
+            fmt = literals[0] + "".join(
+                [spec + lit for spec, lit in zip(specifiers, literals[1:])]
+            )
+            data = data[:, ~is_constant]
+
+    fmt_row = fmt + "\n"
+    with open(filename, mode="w") as f:
+        if header:
+            f.write("# " + header.replace("\n", "\n# ") + "\n")
+        for i in range(0, data.shape[0], chunk_size):
+            chunk = data[i : i + chunk_size]
+            f.write((fmt_row * chunk.shape[0]) % tuple(chunk.ravel().tolist()))
+
+
 def _get_header_from_phases(xmap: CrystalMap) -> str:
     """Return a string with the .ang file header from the crystal map
     metadata.
@@ -651,20 +746,38 @@ def _get_nrows_ncols_step_sizes(xmap: CrystalMap) -> Tuple[int, int, float, floa
     return nrows, ncols, dy, dx
 
 
-def _get_column_width(max_value: int, decimals: int = 5) -> int:
-    """Get width of column to pass to :func:`numpy.savetxt`, accounting
-    for the decimal point and a sign +/-.
+def _get_column_width(
+    max_value: Union[float, np.ndarray], decimals: int = 5
+) -> Union[int, np.ndarray]:
+    """Get width of column(s) to pass to :func:`_write_data`,
+    accounting for the decimal point and a sign +/-.
 
     Parameters
     ----------
     max_value
+        Maximum value of one column, or an array of maximum values of
+        multiple columns.
     decimals
 
     Returns
     -------
     column_width
+        Width of one column, or an array of widths of multiple columns.
+
+    Raises
+    ------
+    ValueError
+        If a maximum value is NaN or infinite.
     """
-    return len(str(int(max_value // 1))) + decimals + 2
+    if not np.all(np.isfinite(max_value)):
+        raise ValueError(
+            f"Cannot get column width from non-finite maximum value(s) {max_value}"
+        )
+    max_int = np.floor(max_value)
+    n_digits = np.floor(np.log10(np.maximum(np.abs(max_int), 1))).astype(int) + 1
+    # Add one character for the minus sign
+    n_digits += max_int < 0
+    return n_digits + decimals + 2
 
 
 def _get_prop_arrays(
@@ -696,7 +809,6 @@ def _get_prop_arrays(
     """
     # "Image_quality" -> "imagequality" etc.
     prop_names_lower = [k.lower().replace("_", "") for k in prop_names]
-    prop_names_lower_arr = np.array(prop_names_lower)
     # Potential extra names added so that lists are of the same length
     # in the loop
     all_expected_prop_names = [
@@ -707,18 +819,23 @@ def _get_prop_arrays(
     ] + desired_prop_names[4:]
     n_desired_props = len(desired_prop_names)
     prop_arrays = np.zeros((map_size, n_desired_props), dtype=np.float32)
+    # Get which map points are in the data once, instead of per
+    # property via CrystalMap.get_map_data(). Points not in the data
+    # are left as zeros.
+    is_in_data = xmap.get_map_data(
+        np.ones(xmap.size, dtype=bool), fill_value=False
+    ).reshape(map_size)
     for i, (name, names) in enumerate(zip(desired_prop_names, all_expected_prop_names)):
         prop = _get_prop_array(
             xmap=xmap,
             prop_name=name,
             expected_prop_names=names,
             prop_names=prop_names,
-            prop_names_lower_arr=prop_names_lower_arr,
-            decimals=decimals,
+            prop_names_lower=prop_names_lower,
             index=index,
         )
         if prop is not None:
-            prop_arrays[:, i] = prop.reshape(map_size)
+            prop_arrays[is_in_data, i] = np.round(prop, decimals=decimals)
     return prop_arrays
 
 
@@ -727,13 +844,11 @@ def _get_prop_array(
     prop_name: str,
     expected_prop_names: List[str],
     prop_names: List[str],
-    prop_names_lower_arr: np.ndarray,
+    prop_names_lower: List[str],
     index: Optional[int],
-    decimals: int = 5,
-    fill_value: Union[int, float, bool] = 0,
 ) -> Union[np.ndarray, None]:
-    """Return a 1D array (n_points,) with the desired property values or
-    ``None`` if the property cannot be read.
+    """Return a 1D array (n_points_in_data,) with the desired property
+    values or ``None`` if the property cannot be read.
 
     Reasons for why the property cannot be read:
 
@@ -746,34 +861,30 @@ def _get_prop_array(
     prop_name
     expected_prop_names
     prop_names
-    prop_names_lower_arr
+    prop_names_lower
     index
-    decimals
-    fill_value
 
     Returns
     -------
     prop_array
         Property array or none if none found.
     """
-    kwargs = dict(decimals=decimals, fill_value=fill_value)
-    if not len(prop_names_lower_arr) and not prop_name:
+    if not len(prop_names_lower) and not prop_name:
         return
     else:
         if not prop_name:
             # Search for a suitable property
             for k in expected_prop_names:
-                is_equal = k == prop_names_lower_arr
-                if is_equal.any():
-                    prop_name = prop_names[np.argmax(is_equal)]
+                if k in prop_names_lower:
+                    prop_name = prop_names[prop_names_lower.index(k)]
                     break
             else:  # If no suitable property was found
                 return
         # There is a property
         if len(xmap.prop[prop_name].shape) == 1:
             # Return the single array even if `index` is given
-            return xmap.get_map_data(prop_name, **kwargs)
+            return xmap.prop[prop_name]
         else:
             if not index:
                 index = 0
-            return xmap.get_map_data(xmap.prop[prop_name][:, index], **kwargs)
+            return xmap.prop[prop_name][:, index]
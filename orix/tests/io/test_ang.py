@@ -16,6 +16,8 @@
 # You should have received a copy of the GNU General Public License
 # along with orix.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
+
 import numpy as np
 import pytest
 
@@ -23,10 +25,12 @@ from orix.crystal_map import CrystalMap, Phase
 from orix.io import load, loadang, save
 from orix.io.plugins.ang import (
     _get_column_width,
+    _get_file_data,
     _get_header,
     _get_nrows_ncols_step_sizes,
     _get_phases_from_header,
     _get_vendor_columns,
+    _write_data,
 )
 from orix.tests.conftest import (
     ANGFILE_ASTAR_HEADER,
@@ -370,7 +374,9 @@ class TestAngReader:
     def test_get_header(self, temp_ang_file):
         temp_ang_file.write(ANGFILE_ASTAR_HEADER)
         temp_ang_file.close()
-        assert _get_header(open(temp_ang_file.name)) == [
+        header, data_starting_row = _get_header(open(temp_ang_file.name))
+        assert data_starting_row == 15
+        assert header == [
             "# File created from ACOM RES results",
             "# ni-dislocations.res",
             "#     ".rstrip(),
@@ -388,6 +394,80 @@ class TestAngReader:
             "# GRID: SqrGrid#",
         ]
 
+    @pytest.mark.parametrize(
+        "angfile_astar",
+        [((2, 5), (1, 1), np.ones(2 * 5, dtype=int), np.ones((1, 3)))],
+        indirect=True,
+    )
+    def test_get_file_data(self, angfile_astar):
+        with open(angfile_astar) as f:
+            _, data_starting_row = _get_header(f)
+        file_data = _get_file_data(angfile_astar, data_starting_row)
+        assert file_data.shape == (10, 9)
+        assert file_data.dtype == np.float64
+
+        # Skipping the header rows gives the same data as parsing them
+        assert np.allclose(file_data, np.loadtxt(angfile_astar))
+
+    @pytest.mark.parametrize(
+        "angfile_astar",
+        [((2, 5), (1, 1), np.ones(2 * 5, dtype=int), np.ones((1, 3)))],
+        indirect=True,
+    )
+    def test_load_ang_use_cache(self, angfile_astar, monkeypatch):
+        cache_file = f"{angfile_astar}.npy"
+        xmap1 = load(angfile_astar)
+        assert not os.path.isfile(cache_file)
+
+        xmap2 = load(angfile_astar, use_cache=True)
+        assert os.path.isfile(cache_file)
+
+        # The .ang file data is not parsed again
+        monkeypatch.setattr("orix.io.plugins.ang._get_file_data", None)
+        xmap3 = load(angfile_astar, use_cache=True)
+
+        for xmap in [xmap2, xmap3]:
+            assert np.allclose(xmap.rotations.data, xmap1.rotations.data)
+            assert np.allclose(xmap.x, xmap1.x)
+            assert np.allclose(xmap.phase_id, xmap1.phase_id)
+            assert np.allclose(xmap.rel, xmap1.rel)
+
+    @pytest.mark.parametrize(
+        "angfile_tsl",
+        [((5, 3), (0.1, 0.1), np.ones(5 * 3, dtype=int), 1, np.ones((1, 3)))],
+        indirect=True,
+    )
+    def test_load_ang_use_cache_not_indexed(self, angfile_tsl):
+        xmap1 = load(angfile_tsl)
+        _ = load(angfile_tsl, use_cache=True)
+        xmap2 = load(angfile_tsl, use_cache=True)
+
+        # Not indexed points are set also when reading from the cache
+        assert np.any(xmap1.phase_id == -1)
+        assert np.allclose(xmap2.phase_id, xmap1.phase_id)
+        assert np.allclose(xmap2.rotations.data, xmap1.rotations.data)
+        assert np.allclose(xmap2.ci, xmap1.ci)
+
+        # The returned data is not backed by the cache file
+        for arr in [xmap2._x, xmap2._y, xmap2._phase_id]:
+            assert arr.flags.writeable
+            assert not isinstance(arr.base, np.memmap)
+
+    @pytest.mark.parametrize(
+        "angfile_astar",
+        [((2, 5), (1, 1), np.ones(2 * 5, dtype=int), np.ones((1, 3)))],
+        indirect=True,
+    )
+    def test_load_ang_use_cache_save_fails(self, angfile_astar, monkeypatch):
+        def save_read_only(*args, **kwargs):
+            raise OSError("Read-only file system")
+
+        monkeypatch.setattr(np, "save", save_read_only)
+        with pytest.warns(UserWarning, match="Could not save cache file"):
+            xmap = load(angfile_astar, use_cache=True)
+        assert xmap.size == 10
+        assert not os.path.isfile(f"{angfile_astar}.npy")
+
     @pytest.mark.parametrize(
         "expected_vendor, expected_columns, vendor_header",
         [
@@ -418,7 +498,7 @@ class TestAngReader:
 
         temp_ang_file.write(vendor_header)
         temp_ang_file.close()
-        header = _get_header(open(temp_ang_file.name))
+        header, _ = _get_header(open(temp_ang_file.name))
         vendor, column_names = _get_vendor_columns(header, n_cols_file)
 
         assert vendor == expected_vendor
@@ -428,7 +508,7 @@ class TestAngReader:
     def test_get_vendor_columns_unknown(self, temp_ang_file, n_cols_file):
         temp_ang_file.write("Look at me!\nI'm Mr. .ang file!\n")
         temp_ang_file.close()
-        header = _get_header(open(temp_ang_file.name))
+        header, _ = _get_header(open(temp_ang_file.name))
         with pytest.warns(UserWarning, match=f"Number of columns, {n_cols_file}, "):
             vendor, column_names = _get_vendor_columns(header, n_cols_file)
             assert vendor == "unknown"
@@ -521,6 +601,23 @@ class TestAngWriter:
         assert np.allclose(xmap_reload.phase_id - 1, crystal_map.phase_id)
         assert xmap_reload.scan_unit == "um"
 
+    def test_write_read_loop_lossless(self, crystal_map, tmp_path):
+        # Values with eight or more significant digits are written
+        # back unchanged
+        crystal_map.prop["iq"] = np.linspace(100, 9000, crystal_map.size) + 0.87988
+        fname1 = tmp_path / "test_write_read_loop_lossless1.ang"
+        save(filename=fname1, object2write=crystal_map)
+        xmap_reload = load(filename=fname1)
+        fname2 = tmp_path / "test_write_read_loop_lossless2.ang"
+        save(filename=fname2, object2write=xmap_reload)
+
+        with open(fname1) as f1, open(fname2) as f2:
+            lines1 = f1.readlines()
+            lines2 = f2.readlines()
+        # Skip the header line with the phase IDs, which are reversed
+        data_start = [i for i, line in enumerate(lines1) if line[0] != "#"][0]
+        assert lines1[data_start:] == lines2[data_start:]
+
     @pytest.mark.parametrize(
         "crystal_map_input, desired_shape, desired_step_sizes",
         [
@@ -541,11 +638,61 @@ class TestAngWriter:
 
     @pytest.mark.parametrize(
         "max_value, decimals, expected_width",
-        [(3.14, 2, 5), (3.1415, 2, 5), (3.141592, 6, 9)],
+        [(3.14, 2, 5), (3.1415, 2, 5), (3.141592, 6, 9), (-1, 5, 9), (180, 5, 10)],
     )
     def test_get_column_width(self, max_value, decimals, expected_width):
         assert _get_column_width(max_value, decimals) == expected_width
 
+    def test_get_column_width_multiple(self):
+        max_values = np.array([0.5, 9.99, 10, -0.5, -10.2, 123456.7])
+        widths = _get_column_width(max_values, decimals=5)
+        assert np.allclose(widths, [8, 8, 9, 9, 10, 13])
+
+    @pytest.mark.parametrize(
+        "max_value", [np.nan, np.inf, -np.inf, np.array([1.5, np.nan, 2])]
+    )
+    def test_get_column_width_raises(self, max_value):
+        with pytest.raises(ValueError, match="Cannot get column width from non-"):
+            _ = _get_column_width(max_value)
+
+    def test_write_nan_property_raises(self, crystal_map, tmp_path):
+        crystal_map.prop["iq"] = np.full(crystal_map.size, np.nan)
+        with pytest.raises(ValueError, match="Cannot get column width from non-"):
+            save(tmp_path / "nan_prop.ang", crystal_map)
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 100])
+    def test_write_data_as_savetxt(self, tmp_path, chunk_size):
+        data = np.random.random((10, 6)) * 100
+        data[:, 2] = np.arange(10)
+        # Constant columns
+        data[:, 4] = 0
+        data[:, 5] = -1
+        fmt = "%8.5f  %9.5f  %2i  %8.5f  %9.5f  %9.5f"
+        header = "Phase 1\nMaterialName    a\n"
+
+        fname1 = tmp_path / "test_write_data1.ang"
+        _write_data(fname1, data, fmt, header, chunk_size=chunk_size)
+        fname2 = tmp_path / "test_write_data2.ang"
+        np.savetxt(fname2, data, fmt=fmt, header=header)
+
+        with open(fname1) as f1, open(fname2) as f2:
+            assert f1.read() == f2.read()
+
+    def test_write_data_constant_signed_zero(self, tmp_path):
+        data = np.zeros((3, 2))
+        data[1, 0] = -0.0
+        fmt = "%8.5f  %8.5f"
+
+        fname1 = tmp_path / "test_write_data1.ang"
+        _write_data(fname1, data, fmt, "")
+        fname2 = tmp_path / "test_write_data2.ang"
+        np.savetxt(fname2, data, fmt=fmt, header="")
+
+        with open(fname1) as f1, open(fname2) as f2:
+            lines = f1.readlines()
+            assert lines[1] == "-0.00000   0.00000\n"
+            assert lines == f2.readlines()
+
     @pytest.mark.parametrize(
         "extra_prop", ["a", ["abc", "iq"], ["scores", "simulation_indices"]]
     )
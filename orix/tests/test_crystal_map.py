@@ -732,6 +732,37 @@ class TestCrystalMapProp:
 
         assert np.allclose(xmap.prop[prop_name], np.ones(xmap.size) * new_prop_value)
 
+    def test_get_crystal_map_property_is_in_data(self, crystal_map):
+        xmap = crystal_map
+        prop_values = np.arange(xmap.size)
+        xmap.prop["iq"] = prop_values
+
+        # A copy is returned when all points are in the data
+        iq = xmap.prop["iq"]
+        assert np.allclose(iq, prop_values)
+        iq[0] = -1
+        assert np.allclose(xmap.iq, prop_values)
+
+        # Changes to the mask in-place are picked up
+        xmap.is_in_data[0] = False
+        assert np.allclose(xmap.prop["iq"], prop_values[1:])
+        assert np.allclose(xmap.iq, prop_values[1:])
+
+    def test_overwrite_crystal_map_property_caller_array(self, tmp_path):
+        iq = np.arange(6.0)
+        fname = tmp_path / "iq.npy"
+        np.save(fname, iq)
+        iq_memmap = np.load(fname, mmap_mode="r")
+        xmap = CrystalMap(Rotation.identity(6), prop={"iq": iq, "iq_memmap": iq_memmap})
+
+        # Arrays passed to the crystal map are not changed
+        xmap.prop["iq"] = np.zeros(6)
+        xmap.prop["iq_memmap"] = np.zeros(6)
+        assert np.allclose(iq, np.arange(6))
+        assert np.allclose(iq_memmap, np.arange(6))
+        assert np.allclose(xmap.iq, 0)
+        assert np.allclose(xmap.iq_memmap, 0)
+
 
 class TestCrystalMapMasking:
     def test_getitem_with_masking(self, crystal_map_input):
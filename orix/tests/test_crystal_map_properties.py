@@ -16,6 +16,8 @@
 # You should have received a copy of the GNU General Public License
 # along with orix.  If not, see <http://www.gnu.org/licenses/>.
 
+import weakref
+
 import numpy as np
 import pytest
 
@@ -105,3 +107,80 @@ class TestCrystalMapProperties:
         with pytest.raises(IndexError, match="boolean index did not match indexed"):
             new_shape = (10 // 2, 10 // 5)
             props["dp"] = np.arange(map_size).reshape(new_shape)
+
+    def test_get_item_is_in_data(self):
+        map_size = 10
+        d = {"iq": np.arange(map_size)}
+        props = CrystalMapProperties(d, id=np.arange(map_size))
+        assert np.allclose(props["iq"], np.arange(map_size))
+
+        # Setting a new mask updates the points returned
+        is_in_data = np.ones(map_size, dtype=bool)
+        is_in_data[5] = False
+        props.is_in_data = is_in_data
+        assert np.allclose(props["iq"], np.arange(map_size)[is_in_data])
+
+    def test_get_item_all_in_data_copy(self):
+        map_size = 10
+        d = {"prop_2d": np.arange(map_size * 2).reshape(map_size, 2)}
+        props = CrystalMapProperties(d, id=np.arange(map_size))
+
+        # A copy is returned even though all points are in the data
+        prop_2d = props["prop_2d"]
+        assert np.allclose(prop_2d, d["prop_2d"])
+        prop_2d[0] = -1
+        assert np.allclose(props["prop_2d"], d["prop_2d"])
+        assert not np.may_share_memory(props["prop_2d"], props.get("prop_2d"))
+
+    def test_set_item_new(self):
+        map_size = 10
+        props = CrystalMapProperties({}, id=np.arange(map_size))
+
+        # All points in the data
+        props["iq"] = np.arange(map_size, dtype=np.float32)
+        assert props.get("iq").dtype == np.float32
+        assert np.allclose(props.get("iq"), np.arange(map_size))
+
+        # Points not in the data are set to zero
+        is_in_data = np.ones(map_size, dtype=bool)
+        is_in_data[5] = False
+        props.is_in_data = is_in_data
+        props["dp"] = 1
+        expected_array = np.ones(map_size)
+        expected_array[5] = 0
+        assert np.allclose(props.get("dp"), expected_array)
+
+    def test_set_item_caller_array_unchanged(self):
+        map_size = 6
+        iq = np.arange(map_size, dtype=float)
+        iq_read_only = np.arange(map_size, dtype=float)
+        iq_read_only.flags.writeable = False
+        d = {"iq": iq, "iq_read_only": iq_read_only}
+        props = CrystalMapProperties(d, id=np.arange(map_size))
+
+        # Arrays passed on initialization are not updated in-place
+        props["iq"] = np.zeros(map_size)
+        props["iq_read_only"] = np.zeros(map_size)
+        assert np.allclose(iq, np.arange(map_size))
+        assert np.allclose(iq_read_only, np.arange(map_size))
+        assert np.allclose(props["iq"], 0)
+        assert np.allclose(props["iq_read_only"], 0)
+
+        # Arrays created when setting are updated in-place
+        iq2 = props.get("iq")
+        props["iq"] = 1.0
+        assert props.get("iq") is iq2
+        assert np.allclose(iq2, 1)
+
+    def test_del_item_frees_array(self):
+        map_size = 6
+        props = CrystalMapProperties({}, id=np.arange(map_size))
+        props["iq"] = np.arange(map_size)
+        props["ci"] = np.arange(map_size)
+        iq_ref = weakref.ref(props.get("iq"))
+        ci_ref = weakref.ref(props.get("ci"))
+
+        del props["iq"]
+        assert iq_ref() is None
+        props.clear()
+        assert ci_ref() is None